@@ -263,7 +263,11 @@ def evolve(args: argparse.Namespace) -> None:
             if args.keep_logs:
                 log_path = Path(args.keep_logs) / f"gen{generation}_{abs(hash(key))}.log"
                 log_path.parent.mkdir(parents=True, exist_ok=True)
-                log_path.write_text(output + ("\n" + error if error else ""), encoding="utf-8")
+                with log_path.open("w", encoding="utf-8") as handle:
+                    handle.write(output)
+                    if error:
+                        handle.write("\n")
+                        handle.write(error)
             scores.append((candidate, score))
 
         scores.sort(key=lambda item: item[1], reverse=True)